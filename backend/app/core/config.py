@@ -19,11 +19,14 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     LOG_LEVEL: str = "info"
     
-    # Database connection pool settings
-    DB_POOL_SIZE: int = 10
-    DB_MAX_OVERFLOW: int = 10
+    # Database connection pool settings (per worker process)
+    # 4 gunicorn workers x (5 + 3) = 32 connections per instance, so two
+    # instances during a deploy stay well under db.t3.micro's max_connections
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 3
     DB_POOL_TIMEOUT: int = 30
     DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = False
     
     class Config:
         env_file = ".env"
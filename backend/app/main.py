@@ -1,3 +1,4 @@
+import logging
 import os
 import time
 # from contextlib import asynccontextmanager
@@ -7,6 +8,8 @@ from app.routes import call_routes, ws_routes, auth_routes, phone_number_routes
 from app.middleware.security import SecurityMiddleware
 from app.core import get_settings
 
+logger = logging.getLogger(__name__)
+
 
 # @asynccontextmanager
 # async def lifespan(app: FastAPI):
@@ -46,10 +49,10 @@ def create_app() -> FastAPI:
 
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = await call_next(request)
-        process_time = time.time() - start_time
-        print(f"{request.method} {request.url.path} took {process_time:.2f}s")
+        process_time = time.perf_counter() - start_time
+        logger.debug("%s %s took %.2fs", request.method, request.url.path, process_time)
         return response
 
     return app
@@ -19,15 +19,15 @@ class SecurityMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
         try:
             # Rate limiting
-            self.logger.info("Checking rate limit for request.")
+            self.logger.debug("Checking rate limit for request.")
             await self._check_rate_limit(request)
             
             # Process the request and get response
-            self.logger.info("Processing request through call_next.")
+            self.logger.debug("Processing request through call_next.")
             response = await call_next(request)
             
             # Add security headers
-            self.logger.info("Adding security headers to response.")
+            self.logger.debug("Adding security headers to response.")
             response.headers["X-Content-Type-Options"] = "nosniff"
             response.headers["X-Frame-Options"] = "DENY"
             response.headers["X-XSS-Protection"] = "1; mode=block"
@@ -43,7 +43,7 @@ class SecurityMiddleware(BaseHTTPMiddleware):
 
     async def _check_rate_limit(self, request: Request):
         client_ip = request.client.host
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Clean old requests
         self._requests = {
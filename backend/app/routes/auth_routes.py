@@ -5,7 +5,9 @@ from app.models.user import User
 from app.models.login import GoogleLoginRequest
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+import logging
 
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["authentication"])
 
@@ -17,17 +19,17 @@ async def google_auth(
     db: AsyncSession = Depends(get_db),
     auth_service = Depends(get_auth_service)
 ):
-    logger.info(f"Received /google-login request. login_data: {login_data}")
+    logger.debug("Received /google-login request.")
     try:
         # Verify Google token and get user info
         logger.debug("Attempting to verify Google token with code...")
         user_data = await auth_service.verify_google_token(login_data.code)
-        logger.debug(f"Google token verified. User data: {user_data}")
+        logger.debug("Google token verified.")
         
         # Get or create user
         logger.debug("Attempting to get or create user...")
         user = await auth_service.get_or_create_user(db, user_data)
-        logger.debug(f"User retrieved/created: {user.id}")
+        logger.debug("User retrieved/created: %s", user.id)
         
         # Create access token with fingerprint
         access_token, expires, csrf_token = auth_service.create_access_token(user.id, request)
@@ -82,7 +84,6 @@ async def get_current_user(
     try:
         # Get token from cookies
         token = request.cookies.get("access_token")
-        print(f"Received token: {token}")
         
         if not token:
             raise HTTPException(
@@ -92,7 +93,7 @@ async def get_current_user(
         
         # Verify token and get user ID
         user_id = auth_service.verify_token(token, request)
-        print(f"Extracted User ID: {user_id}")
+        logger.debug("Extracted User ID: %s", user_id)
         
         # Use async query
         result = await db.execute(select(User).filter(User.id == user_id))
@@ -10,7 +10,7 @@ from app.models.user import User
 from app.models.phone_number import BuyNumberRequest, BuyNumberResponse
 from app.services.twilio_service import TwilioService
 from app.services.auth_service import AuthService
-from app.services import get_twilio_service
+from app.services import get_twilio_service, get_auth_service
 import logging
 
 logger = logging.getLogger(__name__)
@@ -20,13 +20,13 @@ router = APIRouter(prefix="/phone-number", tags=["phone-number"])
 
 @router.get("/get-registered-twilio-number", response_model=dict)
 async def get_twilio_number(request: Request,
-                      db: AsyncSession = Depends(get_db)) -> JSONResponse:
+                      db: AsyncSession = Depends(get_db),
+                      auth_service: AuthService = Depends(get_auth_service)) -> JSONResponse:
     """Check if the user has a Twilio number"""
     token = request.cookies.get("access_token")
-    auth_service = AuthService()
     user_id = auth_service.verify_token(token, request)
     # user_id = request.state.user_id
-    print(f"User ID: {user_id}")
+    logger.debug("User ID: %s", user_id)
     result = await db.execute(
         select(User).filter(User.id == user_id)
     )
@@ -64,7 +64,8 @@ async def buy_number(
     number_requested: BuyNumberRequest,
     request: Request,
     db: AsyncSession = Depends(get_db),
-    twilio_service: TwilioService = Depends(get_twilio_service)
+    twilio_service: TwilioService = Depends(get_twilio_service),
+    auth_service: AuthService = Depends(get_auth_service)
 ) -> BuyNumberResponse:
     """
         Buys a new phone number using the Twilio service.
@@ -75,7 +76,6 @@ async def buy_number(
         if resp["status"] != 200:
             return BuyNumberResponse(success=False, message=resp["message"])
         token = request.cookies.get("access_token")
-        auth_service = AuthService()
         user_id = auth_service.verify_token(token, request)
         await db.execute(
             User.update().where(User.id == user_id).values(twilio_number=number)
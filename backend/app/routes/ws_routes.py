@@ -40,16 +40,30 @@ async def websocket_endpoint(
         
         async with session:            
             session.twilio_ws = ws
-            session.openai_ws = await openai_service.connect()
-                        
-            session.calendar_events = await get_calendar_events(session.user)
+            # Connecting to OpenAI and fetching the calendar are independent, overlap them.
+            # get_calendar_events never raises, so a connect() failure propagates as-is.
+            session.openai_ws, session.calendar_events = await asyncio.gather(
+                openai_service.connect(),
+                get_calendar_events(session.user),
+            )
             await openai_service.start_session(ws=session.openai_ws, events=session.calendar_events)
             
             
-            await asyncio.gather(
-                twilio_service.receive_audio(twilio_ws=session.twilio_ws, openai_ws=session.openai_ws),
-                openai_service.receive_audio(session)
-            )
+            # Whichever side finishes first ends the call, so stop the other relay
+            # instead of leaving it blocked on a socket that will never close.
+            relay_tasks = [
+                asyncio.create_task(twilio_service.receive_audio(twilio_ws=session.twilio_ws, openai_ws=session.openai_ws)),
+                asyncio.create_task(openai_service.receive_audio(session)),
+            ]
+            try:
+                done, _ = await asyncio.wait(relay_tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()  # Surface relay errors to the handler below
+            finally:
+                # Also runs if this endpoint is cancelled, so no relay outlives the session
+                for task in relay_tasks:
+                    task.cancel()
+                await asyncio.gather(*relay_tasks, return_exceptions=True)
 
     except Exception as e:
         print(f"Error in websocket endpoint: {e}")
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 import uuid
 import jwt
@@ -27,6 +28,7 @@ class AuthService:
         self.access_token_expire_minutes = 120
         self.refresh_token_expire_days = 30,
         self.frontend_url = settings.FRONTEND_URL
+        self.google_request_timeout = 10  # seconds
         
     async def _get_user_timezone(self, refresh_token: str) -> str:
         """Get user's timezone from their primary calendar"""
@@ -38,8 +40,11 @@ class AuthService:
                 'scopes': ["https://www.googleapis.com/auth/calendar.events", "https://www.googleapis.com/auth/calendar.readonly"]
             })
             
-            service = build('calendar', 'v3', credentials=credentials)
-            calendar = service.calendars().get(calendarId='primary').execute()
+            # Run the blocking Google API client in a separate thread
+            calendar = await asyncio.to_thread(
+                lambda: build('calendar', 'v3', credentials=credentials)
+                .calendars().get(calendarId='primary').execute()
+            )
             return calendar.get('timeZone', 'UTC')
         except HttpError as error:
             print(f'Error fetching timezone: {error}')
@@ -85,7 +90,7 @@ class AuthService:
             expected_csrf = payload.get("csrf")
             if csrf_token:
                 if not expected_csrf or csrf_token != expected_csrf:
-                    print(f"CSRF Mismatch: Header='{csrf_token}', Expected='{expected_csrf}'")
+                    logger.warning("CSRF token mismatch")
                     raise HTTPException(
                         status_code=status.HTTP_403_FORBIDDEN, # Use 403 for CSRF failure
                         detail="Invalid CSRF token"
@@ -119,9 +124,11 @@ class AuthService:
 
     async def verify_google_token(self, token: str) -> dict:
         try:
-            print(f"Verifying token: {token}")
+            logger.debug("Exchanging Google authorization code")
 
-            token_response = requests.post(
+            # Run the blocking HTTP calls in a separate thread to avoid stalling the event loop
+            token_response = await asyncio.to_thread(
+                requests.post,
                 'https://oauth2.googleapis.com/token',
                 data={
                     'code': token,
@@ -129,21 +136,23 @@ class AuthService:
                     'client_secret': self.google_client_secret,
                     'redirect_uri': self.frontend_url,
                     'grant_type': 'authorization_code',
-                }
+                },
+                timeout=self.google_request_timeout,
             )
             
-            token_response_text = token_response.text
             if not token_response.ok:
-                print(f"Token exchange failed with status {token_response.status_code}. Response: {token_response_text}")
-                raise Exception(f"Token exchange failed: {token_response_text}")
+                logger.error("Token exchange failed with status %s", token_response.status_code)
+                raise Exception(f"Token exchange failed with status {token_response.status_code}")
             
             token_data = token_response.json()
             refresh_token = token_data.get('refresh_token')
             
             # Get user info using access token
-            userinfo_response = requests.get(
+            userinfo_response = await asyncio.to_thread(
+                requests.get,
                 'https://www.googleapis.com/oauth2/v3/userinfo',
-                headers={'Authorization': f'Bearer {token_data["access_token"]}'}
+                headers={'Authorization': f'Bearer {token_data["access_token"]}'},
+                timeout=self.google_request_timeout,
             )
             user_info = userinfo_response.json()
             
@@ -21,6 +21,42 @@ class OpenAiService:
         "session.created",
     ]
 
+    # Tool definitions are identical for every call, build them once
+    TOOLS = [
+        {
+            "type": "function",
+            "name": "hang_up",
+            "description": "End the call immediately",
+        },
+        {
+            "type": "function",
+            "name": "schedule_call",
+            "description": "Send a scheduling link to the caller",
+        },
+        {
+            "type": "function",
+            "name": "transfer_call",
+            "description": "Transfer the call to Sarthak",
+        },
+    ]
+
+    # Greeting messages never change, so they are serialized once at import
+    INITIAL_CONVERSATION_ITEM = json.dumps({
+        "type": "conversation.item.create",
+        "item": {
+            "type": "message",
+            "role": "user",
+            "content": [
+                {
+                    "type": "input_text",
+                    # "text": "Greet the user with 'Hello, I am Alex an AI voice assistant I handle all communications and scheduling for Sarthak. How can I assist you today?'",
+                    "text": "Greet the user with 'Hello, I am Alex an AI voice assistant. How can I assist you today?'",
+                }
+            ],
+        },
+    })
+    RESPONSE_CREATE = json.dumps({"type": "response.create"})
+
     
         
     def get_test_prompt(self) -> str:
@@ -131,23 +167,7 @@ class OpenAiService:
                 # "instructions": self.get_prompt(events),
                 "instructions": self.get_test_prompt(),
                 
-                "tools": [
-                    {
-                        "type": "function",
-                        "name": "hang_up",
-                        "description": "End the call immediately",
-                    },
-                    {
-                        "type": "function",
-                        "name": "schedule_call",
-                        "description": "Send a scheduling link to the caller",
-                    },
-                    {
-                        "type": "function",
-                        "name": "transfer_call",
-                        "description": "Transfer the call to Sarthak",
-                    },
-                ],
+                "tools": self.TOOLS,
             },
         }
         await ws.send(json.dumps(session_update))
@@ -158,22 +178,8 @@ class OpenAiService:
         if not ws:
             raise RuntimeError("WebSocket connection not established")
 
-        initial_conversation_item = {
-            "type": "conversation.item.create",
-            "item": {
-                "type": "message",
-                "role": "user",
-                "content": [
-                    {
-                        "type": "input_text",
-                        # "text": "Greet the user with 'Hello, I am Alex an AI voice assistant I handle all communications and scheduling for Sarthak. How can I assist you today?'",
-                        "text": "Greet the user with 'Hello, I am Alex an AI voice assistant. How can I assist you today?'",
-                    }
-                ],
-            },
-        }
-        await ws.send(json.dumps(initial_conversation_item))
-        await ws.send(json.dumps({"type": "response.create"}))
+        await ws.send(self.INITIAL_CONVERSATION_ITEM)
+        await ws.send(self.RESPONSE_CREATE)
 
     async def receive_audio(self, session) -> None:
         """Receive audio stream from OpenAI and send it to Twilio"""
@@ -182,40 +188,41 @@ class OpenAiService:
             raise RuntimeError("WebSocket connection not established")
 
         function_name = None
+        openai_ws = session.openai_ws
+        twilio_ws = session.twilio_ws
+        # The stream SID is fixed for the call and audio deltas are base64, so the
+        # Twilio media frame is serialized once and only the payload is spliced in
+        media_prefix = '{"event":"media","streamSid":' + json.dumps(session.stream_sid) + ',"media":{"payload":"'
+        media_suffix = '"}}'
         try:
-            async for message in session.openai_ws:
+            async for message in openai_ws:
                 data = json.loads(message)
                 
-                if session.openai_ws and session.openai_ws.state.value != 1:
-                    break
-                
                 if "error" in data:
                     print(f"Error: {data['error']}")
                     raise Exception(data["error"])
 
-                if data.get("type") == "response.audio.delta" and "delta" in data:
+                event_type = data.get("type")
 
-                    response_audio = {
-                        "event": "media",
-                        "streamSid": session.stream_sid,
-                        "media": {"payload": data["delta"]},
-                    }
-                    await session.twilio_ws.send_json(response_audio)
+                if event_type == "response.audio.delta" and "delta" in data:
+                    await twilio_ws.send_text(media_prefix + data["delta"] + media_suffix)
 
-                if data.get("type") == "response.function_call_arguments.done":
+                elif event_type == "response.function_call_arguments.done":
                     # Not menthiioned in the api docs but it containes a name key
                     function_name = data["name"]
 
-                if data.get("type") == "response.done":
-                    if function_name == "hang_up":
+                elif event_type == "response.done" and function_name:
+                    # Handle each tool call once; later responses must not replay it
+                    tool_call, function_name = function_name, None
+                    if tool_call == "hang_up":
                         self.twilio_service.end_call(session.call_sid)
                         break
 
-                    elif function_name == "schedule_call":
+                    elif tool_call == "schedule_call":
                         self.twilio_service.send_sms(session.user.user_number, session.from_number, session.user.full_name, session.user.calendar_url)
                         
 
-                    elif function_name == "transfer_call":
+                    elif tool_call == "transfer_call":
                         self.twilio_service.transfer_call(session.call_sid, session.user.user_number)
                         break
 
@@ -1,15 +1,24 @@
 import asyncio
 import json
-from turtle import st
+import logging
+import re
 import uuid
-from venv import logger
 from fastapi import WebSocket
-from openai import BadRequestError
+from twilio.base.exceptions import TwilioRestException
 from twilio.rest import Client as TwilioClient
 from app.sessions.user_sessions import sessions
 from app.core import Settings
 
+logger = logging.getLogger(__name__)
+
 class TwilioService:
+    # Twilio media payloads are base64, so they can be spliced into the
+    # OpenAI append event without a json.dumps per frame. The payload comes
+    # from the websocket peer, so only splice it when it really is base64.
+    AUDIO_APPEND_PREFIX = '{"type": "input_audio_buffer.append", "audio": "'
+    AUDIO_APPEND_SUFFIX = '"}'
+    BASE64_PAYLOAD = re.compile(r"[A-Za-z0-9+/]*={0,2}")
+
     def __init__(self, settings: Settings):
         self.client = TwilioClient(settings.TWILIO_ACCOUNT_SID, settings.TWILIO_AUTH_TOKEN)       
         
@@ -32,23 +41,26 @@ class TwilioService:
         try:
             async for message in twilio_ws.iter_text():
                 data = json.loads(message)
+                event = data["event"]
                 
-                if data["event"] == "stop":
+                if event == "stop":
                     print("Closed Message received", message)
                     break
 
-                if data["event"] == "media" and openai_ws.state.value == 1:
-                    payload = {
-                        "type": "input_audio_buffer.append",
-                        "audio": data["media"]["payload"],
-                    }
-                    await openai_ws.send(json.dumps(payload))
+                if event == "media" and openai_ws.state.value == 1:
+                    await openai_ws.send(self._audio_append_frame(data["media"]["payload"]))
                 
 
         except Exception as e:
             print(f"Error receiving audio in twilio: {e}")
         
 
+    def _audio_append_frame(self, payload) -> str:
+        """Build the OpenAI append event, falling back to json.dumps for non-base64 payloads"""
+        if isinstance(payload, str) and self.BASE64_PAYLOAD.fullmatch(payload):
+            return self.AUDIO_APPEND_PREFIX + payload + self.AUDIO_APPEND_SUFFIX
+        return json.dumps({"type": "input_audio_buffer.append", "audio": payload})
+
     # In TwilioService class
     async def get_available_numbers(self, country_code="US", area_code=None, limit=20):
         """Fetch available phone numbers with error handling"""
@@ -91,7 +103,7 @@ class TwilioService:
             }
             return formatted_response
         
-        except BadRequestError as e:
+        except TwilioRestException as e:
             logger.error(f"Error buying number: {str(e)}")
             return {"status": getattr(e, 'status', 400),
                     "message": e.msg}
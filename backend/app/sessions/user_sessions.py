@@ -29,8 +29,9 @@ class UserSession:
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self.twilio_ws.close()
         print(f"Closed Twilio connection for user {self.user_id}")
-        await self.openai_ws.close()
-        print(f"Closed OpenAI connection for user {self.user_id}")
+        if self.openai_ws is not None:
+            await self.openai_ws.close()
+            print(f"Closed OpenAI connection for user {self.user_id}")
         del sessions[self.user_id]
 
 
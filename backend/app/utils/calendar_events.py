@@ -1,3 +1,4 @@
+import asyncio
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
@@ -30,22 +31,22 @@ async def get_calendar_events(user: User) -> str:
             'scopes': ["https://www.googleapis.com/auth/calendar.events"]
         })
 
-        # Build service
-        service = build('calendar', 'v3', credentials=credentials)
-        
         # Use stored timezone from user model
         timezone = pytz.timezone(user.timezone)
         now = datetime.datetime.now(timezone)
         start_of_day = now.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = start_of_day + datetime.timedelta(days=1)
 
-        events_result = service.events().list(
-            calendarId='primary',
-            timeMin=start_of_day.isoformat(),
-            timeMax=end_of_day.isoformat(),
-            singleEvents=True,
-            orderBy='startTime'
-        ).execute()
+        # Build service and fetch events in a separate thread to avoid blocking
+        events_result = await asyncio.to_thread(
+            lambda: build('calendar', 'v3', credentials=credentials).events().list(
+                calendarId='primary',
+                timeMin=start_of_day.isoformat(),
+                timeMax=end_of_day.isoformat(),
+                singleEvents=True,
+                orderBy='startTime'
+            ).execute()
+        )
         
         events = events_result.get('items', [])
         events_resp = f"The current date and time is {now.strftime('%Y-%m-%d %H:%M:%S')} and the timezone is {user.timezone}. Here are the events for today: "